@@ -1,7 +1,25 @@
 """DLNA/UPnP Media Server Compliance Tester."""
 
-from .tester import DLNATester
-from .tests import TestResult, TestSuite
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .tester import DLNATester
+    from .tests import TestResult, TestSuite
 
 __version__ = "1.0.0"
 __all__ = ["DLNATester", "TestResult", "TestSuite"]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the public classes on first access to keep CLI startup fast."""
+    if name == "DLNATester":
+        from .tester import DLNATester
+
+        return DLNATester
+    if name in ("TestResult", "TestSuite"):
+        from . import tests
+
+        return getattr(tests, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,77 +2,200 @@
 
 from __future__ import annotations
 
-import argparse
+import functools
+import os
 import sys
-from typing import NoReturn
+from collections import Counter, defaultdict
+from typing import TYPE_CHECKING, Any, Iterator, NamedTuple, NoReturn
 
-from .tester import DLNATester
-from .tests import TestCategory, TestStatus, TestSuite
+# The tester and test suite pull in httpx and lxml, so they are imported
+# inside the run_* functions to keep --help and argument errors fast.
+if TYPE_CHECKING:
+    import argparse
+    from concurrent.futures import Future
 
+    import httpx
 
-# ANSI color codes
-class Colors:
-    RESET = "\033[0m"
-    BOLD = "\033[1m"
-    RED = "\033[91m"
-    GREEN = "\033[92m"
-    YELLOW = "\033[93m"
-    BLUE = "\033[94m"
-    CYAN = "\033[96m"
-    GRAY = "\033[90m"
+    from .tester import DLNATester, MediaItem
+    from .tests import TestCategory, TestStatus
+
+
+# Number of concurrent Browse requests used when walking the library
+BROWSE_WORKERS = 8
+
+# File extensions and MIME types treated as playable video by --playmedia
+VIDEO_EXTENSIONS = (".mkv", ".mp4")
+VIDEO_MIME_TYPES = ("video/x-matroska", "video/mp4")
+
+# Headers sent with every --playmedia range request, as a renderer would
+PLAYBACK_HEADERS = {
+    "User-Agent": "DLNA-Tester/1.0 UPnP/1.0",
+    "transferMode.dlna.org": "Streaming",
+}
+
+
+class Palette(NamedTuple):
+    """ANSI escape sequences used for colored output."""
+
+    RESET: str
+    BOLD: str
+    RED: str
+    GREEN: str
+    YELLOW: str
+    BLUE: str
+    CYAN: str
+    GRAY: str
+
+
+ANSI_COLORS = Palette(
+    RESET="\033[0m",
+    BOLD="\033[1m",
+    RED="\033[91m",
+    GREEN="\033[92m",
+    YELLOW="\033[93m",
+    BLUE="\033[94m",
+    CYAN="\033[96m",
+    GRAY="\033[90m",
+)
+NO_COLORS = Palette(*("" for _ in Palette._fields))
+
+# Active palette; main() switches it to NO_COLORS for --no-color
+Colors = ANSI_COLORS
 
 
 def colorize(text: str, color: str) -> str:
     """Apply ANSI color to text."""
+    if not color:
+        return text
     return f"{color}{text}{Colors.RESET}"
 
 
+def _plain(text: str, color: str) -> str:
+    """Stand-in for colorize() under --no-color; returns text untouched."""
+    return text
+
+
+class LineBuffer:
+    """Collects output lines and writes them to stdout in a single call."""
+
+    __slots__ = ("lines",)
+
+    def __init__(self) -> None:
+        self.lines: list[str] = []
+
+    def write(self, line: str = "") -> None:
+        """Queue a line of output."""
+        self.lines.append(line)
+
+    def flush(self) -> None:
+        """Write all queued lines to stdout."""
+        if self.lines:
+            self.lines.append("")
+            sys.stdout.write("\n".join(self.lines))
+            self.lines.clear()
+
+
+# Status/grade lookup tables, built from the current Colors values.
+# Statuses are keyed by their value so the tests module isn't needed here.
+_STATUS_ICONS: dict[str, str] = {
+    "PASS": "✓",
+    "FAIL": "✗",
+    "WARN": "⚠",
+    "SKIP": "○",
+}
+_STATUS_COLORS: dict[str, str] = {}
+_GRADE_COLORS: dict[str, str] = {}
+# Pre-colored "    <icon> [STATUS] " prefixes for result rows
+_ROW_PREFIXES: dict[str, str] = {}
+# Pre-colored %-templates for section headers and result detail lines
+_BANNERS: dict[str, str] = {}
+# Grade frame lines; the middle one takes the (colored) grade via %
+_GRADE_BOX_TOP = "  ╔═══════════════════╗"
+_GRADE_BOX_MID = "  ║   GRADE: %s       ║"
+_GRADE_BOX_BOT = "  ╚═══════════════════╝"
+
+
+def _build_color_tables() -> None:
+    """(Re)build the color lookup tables after Colors has changed."""
+    _STATUS_COLORS.update({
+        "PASS": Colors.GREEN,
+        "FAIL": Colors.RED,
+        "WARN": Colors.YELLOW,
+        "SKIP": Colors.GRAY,
+    })
+    _GRADE_COLORS.update({
+        "A": Colors.GREEN,
+        "B": Colors.CYAN,
+        "C": Colors.YELLOW,
+    })
+    for value, icon in _STATUS_ICONS.items():
+        color = _STATUS_COLORS[value]
+        # Icon and label share a color, so one escape/reset pair covers both
+        _ROW_PREFIXES[value] = f"    {colorize(f'{icon} [{value}]', color)} "
+    _BANNERS["header"] = colorize("═══ %s ═══", Colors.BOLD + Colors.CYAN)
+    _BANNERS["subheader"] = colorize("─── %s ───", Colors.BLUE)
+    _BANNERS["detail"] = "      " + colorize("%s", Colors.GRAY)
+
+
+_build_color_tables()
+
+
 def status_color(status: TestStatus) -> str:
     """Get color for a test status."""
-    return {
-        TestStatus.PASS: Colors.GREEN,
-        TestStatus.FAIL: Colors.RED,
-        TestStatus.WARN: Colors.YELLOW,
-        TestStatus.SKIP: Colors.GRAY,
-    }.get(status, Colors.RESET)
+    return _STATUS_COLORS.get(status.value, Colors.RESET)
 
 
 def status_icon(status: TestStatus) -> str:
     """Get icon for a test status."""
-    return {
-        TestStatus.PASS: "✓",
-        TestStatus.FAIL: "✗",
-        TestStatus.WARN: "⚠",
-        TestStatus.SKIP: "○",
-    }.get(status, "?")
+    return _STATUS_ICONS.get(status.value, "?")
 
 
-def print_header(text: str) -> None:
-    """Print a section header."""
-    print()
-    print(colorize(f"═══ {text} ═══", Colors.BOLD + Colors.CYAN))
+# Listing icons by upnp:class; checked in order, first match wins
+_ITEM_ICONS = (
+    ("audioItem", "🎵"),
+    ("videoItem", "🎬"),
+    ("imageItem", "🖼️ "),
+)
 
 
-def print_subheader(text: str) -> None:
-    """Print a subsection header."""
-    print()
-    print(colorize(f"─── {text} ───", Colors.BLUE))
+@functools.lru_cache(maxsize=64)
+def item_icon(item_class: str) -> str:
+    """Get the listing icon for a upnp:class value."""
+    for needle, icon in _ITEM_ICONS:
+        if needle in item_class:
+            return icon
+    return "📄"
+
+
+def truncate(text: str, limit: int) -> str:
+    """Shorten text to at most limit characters, marking the cut with '...'."""
+    return text if len(text) <= limit else f"{text[:limit - 3]}..."
+
+
+def print_header(text: str, out: LineBuffer | None = None) -> None:
+    """Print a section header, or queue it on out if given."""
+    write = out.write if out is not None else print
+    write()
+    write(_BANNERS["header"] % text)
+
+
+def print_subheader(text: str, out: LineBuffer | None = None) -> None:
+    """Print a subsection header, or queue it on out if given."""
+    write = out.write if out is not None else print
+    write()
+    write(_BANNERS["subheader"] % text)
 
 
 def grade_color(grade: str) -> str:
     """Get color for a grade."""
-    if grade.startswith("A"):
-        return Colors.GREEN
-    elif grade.startswith("B"):
-        return Colors.CYAN
-    elif grade.startswith("C"):
-        return Colors.YELLOW
-    else:
-        return Colors.RED
+    return _GRADE_COLORS.get(grade[:1], Colors.RED)
 
 
-def main() -> NoReturn:
-    """Main entry point for the CLI."""
+@functools.cache
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser (once per process)."""
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="DLNA/UPnP Media Server Compliance Tester",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -132,8 +255,14 @@ This tool tests a DLNA media server for protocol compliance by:
         action="store_true",
         help="Simulate playing a video file (mkv/mp4) by making HTTP requests like a real DLNA client",
     )
+    return parser
 
-    args = parser.parse_args()
+
+def main() -> NoReturn:
+    """Main entry point for the CLI."""
+    global Colors, colorize
+
+    args = build_parser().parse_args()
 
     # --playmedia implies --full-scan
     if args.playmedia:
@@ -141,78 +270,100 @@ This tool tests a DLNA media server for protocol compliance by:
 
     # Disable colors if requested
     if args.no_color:
-        Colors.RESET = ""
-        Colors.BOLD = ""
-        Colors.RED = ""
-        Colors.GREEN = ""
-        Colors.YELLOW = ""
-        Colors.BLUE = ""
-        Colors.CYAN = ""
-        Colors.GRAY = ""
-
-    if args.listing:
-        run_listing(args.host, args.port, args.timeout, args.max_items, args.no_color)
-    elif args.playmedia:
-        run_playmedia(args.host, args.port, args.timeout, args.max_items, args.verbose)
-    elif args.json:
-        run_json_output(args.host, args.port, args.timeout, args.verbose, args.full_scan, args.max_items)
-    else:
-        run_interactive(args.host, args.port, args.timeout, args.verbose, args.full_scan, args.max_items)
+        Colors = NO_COLORS
+        colorize = _plain
+        _build_color_tables()
+
+    try:
+        if args.listing:
+            run_listing(args.host, args.port, args.timeout, args.max_items, args.no_color)
+        elif args.playmedia:
+            run_playmedia(args.host, args.port, args.timeout, args.max_items, args.verbose)
+        elif args.json:
+            run_json_output(args.host, args.port, args.timeout, args.verbose, args.full_scan, args.max_items)
+        else:
+            run_interactive(args.host, args.port, args.timeout, args.verbose, args.full_scan, args.max_items)
+    except SystemExit as e:
+        # The run_* functions have closed their tester by the time they exit
+        if isinstance(e.code, int):
+            exit_now(e.code)
+        raise
+
+
+def exit_now(code: int) -> NoReturn:
+    """Flush output and exit immediately, skipping interpreter teardown.
+
+    Only safe once all resources have been released, since atexit handlers
+    and finalizers don't run (this also avoids waiting on idle worker threads).
+    """
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os._exit(code)
 
 
 def find_video_file(tester: DLNATester, max_items: int) -> MediaItem | None:
     """Find a random video file (mkv/mp4) in the media library."""
     import random
-    from .tester import MediaItem
+    from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 
     video_files: list[MediaItem] = []
     items_scanned = 0
 
-    def search_recursive(object_id: str) -> None:
-        nonlocal items_scanned
-
-        if items_scanned >= max_items:
-            return
-
-        result = tester.browse(object_id, "BrowseDirectChildren", "*", 0, 0)
-        if result is None:
-            return
+    # Breadth-first walk: every discovered container is browsed by the pool
+    # right away, so sibling containers are fetched concurrently
+    with ThreadPoolExecutor(max_workers=BROWSE_WORKERS) as executor:
+        pending = {executor.submit(tester.browse, "0", "BrowseDirectChildren", "*", 0, 0)}
+        while pending and items_scanned < max_items:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                result = future.result()
+                if result is None:
+                    continue
 
-        items, _, _ = result
+                items, _, _ = result
 
-        for item in items:
-            if items_scanned >= max_items:
-                return
+                for item in items:
+                    if items_scanned >= max_items:
+                        break
 
-            items_scanned += 1
+                    items_scanned += 1
 
-            if item.is_container:
-                search_recursive(item.id)
-            else:
-                # Check if it's a video file (mkv or mp4)
-                if item.resources:
-                    for res in item.resources:
-                        url = res.get("url", "").lower()
-                        protocol_info = res.get("protocol_info", "").lower()
-                        if any(ext in url for ext in [".mkv", ".mp4"]) or \
-                           any(fmt in protocol_info for fmt in ["video/x-matroska", "video/mp4"]):
-                            video_files.append(item)
-                            break
+                    if item.is_container:
+                        pending.add(
+                            executor.submit(
+                                tester.browse, item.id, "BrowseDirectChildren", "*", 0, 0
+                            )
+                        )
+                    else:
+                        # Check if it's a video file (mkv or mp4)
+                        if item.resources:
+                            for res in item.resources:
+                                # Match the extension on the path, ignoring any query string
+                                path = res.get("url", "").lower().partition("?")[0]
+                                if path.endswith(VIDEO_EXTENSIONS):
+                                    video_files.append(item)
+                                    break
+                                protocol_info = res.get("protocol_info", "").lower()
+                                if any(fmt in protocol_info for fmt in VIDEO_MIME_TYPES):
+                                    video_files.append(item)
+                                    break
+
+        for future in pending:
+            future.cancel()
 
-    search_recursive("0")
     return random.choice(video_files) if video_files else None
 
 
 def run_playmedia(host: str, port: int, timeout: float, max_items: int, verbose: bool) -> NoReturn:
     """Simulate playing a video file like a real DLNA client would."""
-    from .tester import MediaItem
+    from .tester import DLNATester
 
     print_header("DLNA Media Playback Simulation")
     print(f"Server: {colorize(f'{host}:{port}', Colors.BOLD)}")
     print()
 
     try:
-        with DLNATester(host, port, timeout) as tester:
+        with DLNATester(host, port, timeout, cache_browse=True) as tester:
             # Get device info
             device = tester.fetch_device_description()
             if device:
@@ -265,6 +416,35 @@ def run_playmedia(host: str, port: int, timeout: float, max_items: int, verbose:
         sys.exit(2)
 
 
+def read_range(
+    tester: DLNATester, url: str, start: int, end: int
+) -> tuple[httpx.Response, int]:
+    """Send a range GET and drain the body without keeping it, like a player would.
+
+    Reading stops after the requested length, so a server that ignores the
+    Range header and sends the whole file isn't downloaded in full.
+
+    Args:
+        tester: DLNATester whose client is used
+        url: Full resource URL
+        start: First byte offset requested
+        end: Last byte offset requested (inclusive)
+
+    Returns:
+        Tuple of (response, number of body bytes received)
+    """
+    headers = {**PLAYBACK_HEADERS, "Range": f"bytes={start}-{end}"}
+    wanted = end - start + 1
+    received = 0
+    with tester.client.stream("GET", url, headers=headers, follow_redirects=True) as response:
+        for chunk in response.iter_bytes():
+            received += len(chunk)
+            if received >= wanted:
+                received = wanted
+                break
+    return response, received
+
+
 def simulate_playback(tester: DLNATester, url: str, verbose: bool) -> None:
     """Simulate the HTTP requests a real DLNA client would make to play a video.
 
@@ -273,111 +453,105 @@ def simulate_playback(tester: DLNATester, url: str, verbose: bool) -> None:
     2. Sends a GET request with Range header for initial playback
     3. May send additional range requests for seeking
     """
-    import time
-
     full_url = tester._make_url(url)
+    out = LineBuffer()
 
     # Step 1: HEAD request (get content info)
-    print(f"  {colorize('[1/4]', Colors.CYAN)} HEAD request (get content info)...")
+    out.write(f"  {colorize('[1/4]', Colors.CYAN)} HEAD request (get content info)...")
+    out.flush()
     try:
         response = tester.client.head(full_url, follow_redirects=True)
         if verbose:
-            print(f"        Status: {response.status_code}")
-            print(f"        Content-Type: {response.headers.get('Content-Type', 'N/A')}")
-            print(f"        Content-Length: {response.headers.get('Content-Length', 'N/A')}")
-            print(f"        Accept-Ranges: {response.headers.get('Accept-Ranges', 'N/A')}")
+            out.write(f"        Status: {response.status_code}")
+            out.write(f"        Content-Type: {response.headers.get('Content-Type', 'N/A')}")
+            out.write(f"        Content-Length: {response.headers.get('Content-Length', 'N/A')}")
+            out.write(f"        Accept-Ranges: {response.headers.get('Accept-Ranges', 'N/A')}")
         content_length = int(response.headers.get('Content-Length', 0))
         if response.status_code == 200:
-            print(f"        {colorize('✓ OK', Colors.GREEN)}")
+            out.write(f"        {colorize('✓ OK', Colors.GREEN)}")
         else:
-            print(f"        {colorize(f'⚠ Status {response.status_code}', Colors.YELLOW)}")
+            out.write(f"        {colorize(f'⚠ Status {response.status_code}', Colors.YELLOW)}")
     except Exception as e:
-        print(f"        {colorize(f'✗ Failed: {e}', Colors.RED)}")
+        out.write(f"        {colorize(f'✗ Failed: {e}', Colors.RED)}")
         content_length = 0
 
     # Step 2: Initial range request (start of file)
-    print(f"  {colorize('[2/4]', Colors.CYAN)} GET range request (start of file, bytes=0-65535)...")
+    out.write(f"  {colorize('[2/4]', Colors.CYAN)} GET range request (start of file, bytes=0-65535)...")
+    out.flush()
     try:
-        headers = {
-            "Range": "bytes=0-65535",
-            "User-Agent": "DLNA-Tester/1.0 UPnP/1.0",
-            "transferMode.dlna.org": "Streaming",
-        }
-        response = tester.client.get(full_url, headers=headers, follow_redirects=True)
+        response, received = read_range(tester, full_url, 0, 65535)
         if verbose:
-            print(f"        Status: {response.status_code}")
-            print(f"        Content-Range: {response.headers.get('Content-Range', 'N/A')}")
-            print(f"        Bytes received: {len(response.content)}")
+            out.write(f"        Status: {response.status_code}")
+            out.write(f"        Content-Range: {response.headers.get('Content-Range', 'N/A')}")
+            out.write(f"        Bytes received: {received}")
         if response.status_code in (200, 206):
-            print(f"        {colorize('✓ OK', Colors.GREEN)}")
+            out.write(f"        {colorize('✓ OK', Colors.GREEN)}")
         else:
-            print(f"        {colorize(f'⚠ Status {response.status_code}', Colors.YELLOW)}")
+            out.write(f"        {colorize(f'⚠ Status {response.status_code}', Colors.YELLOW)}")
     except Exception as e:
-        print(f"        {colorize(f'✗ Failed: {e}', Colors.RED)}")
+        out.write(f"        {colorize(f'✗ Failed: {e}', Colors.RED)}")
 
     # Step 3: Seek request (middle of file)
     if content_length > 0:
-        print(f"  {colorize('[3/4]', Colors.CYAN)} GET range request (seek to middle)...")
+        out.write(f"  {colorize('[3/4]', Colors.CYAN)} GET range request (seek to middle)...")
+        out.flush()
         try:
             mid_point = content_length // 2
             end_point = min(mid_point + 65535, content_length - 1)
-            headers = {
-                "Range": f"bytes={mid_point}-{end_point}",
-                "User-Agent": "DLNA-Tester/1.0 UPnP/1.0",
-                "transferMode.dlna.org": "Streaming",
-            }
-            response = tester.client.get(full_url, headers=headers, follow_redirects=True)
+            response, received = read_range(tester, full_url, mid_point, end_point)
             if verbose:
-                print(f"        Status: {response.status_code}")
-                print(f"        Requested: bytes={mid_point}-{end_point}")
-                print(f"        Content-Range: {response.headers.get('Content-Range', 'N/A')}")
-                print(f"        Bytes received: {len(response.content)}")
+                out.write(f"        Status: {response.status_code}")
+                out.write(f"        Requested: bytes={mid_point}-{end_point}")
+                out.write(f"        Content-Range: {response.headers.get('Content-Range', 'N/A')}")
+                out.write(f"        Bytes received: {received}")
             if response.status_code in (200, 206):
-                print(f"        {colorize('✓ OK', Colors.GREEN)}")
+                out.write(f"        {colorize('✓ OK', Colors.GREEN)}")
             else:
-                print(f"        {colorize(f'⚠ Status {response.status_code}', Colors.YELLOW)}")
+                out.write(f"        {colorize(f'⚠ Status {response.status_code}', Colors.YELLOW)}")
         except Exception as e:
-            print(f"        {colorize(f'✗ Failed: {e}', Colors.RED)}")
+            out.write(f"        {colorize(f'✗ Failed: {e}', Colors.RED)}")
     else:
-        print(f"  {colorize('[3/4]', Colors.CYAN)} GET range request (seek to middle)...")
-        print(f"        {colorize('○ Skipped (unknown content length)', Colors.GRAY)}")
+        out.write(f"  {colorize('[3/4]', Colors.CYAN)} GET range request (seek to middle)...")
+        out.write(f"        {colorize('○ Skipped (unknown content length)', Colors.GRAY)}")
 
     # Step 4: End of file request (sometimes clients do this)
     if content_length > 65536:
-        print(f"  {colorize('[4/4]', Colors.CYAN)} GET range request (end of file)...")
+        out.write(f"  {colorize('[4/4]', Colors.CYAN)} GET range request (end of file)...")
+        out.flush()
         try:
             start_point = content_length - 65536
-            headers = {
-                "Range": f"bytes={start_point}-{content_length - 1}",
-                "User-Agent": "DLNA-Tester/1.0 UPnP/1.0",
-                "transferMode.dlna.org": "Streaming",
-            }
-            response = tester.client.get(full_url, headers=headers, follow_redirects=True)
+            end_point = content_length - 1
+            response, received = read_range(tester, full_url, start_point, end_point)
             if verbose:
-                print(f"        Status: {response.status_code}")
-                print(f"        Requested: bytes={start_point}-{content_length - 1}")
-                print(f"        Content-Range: {response.headers.get('Content-Range', 'N/A')}")
-                print(f"        Bytes received: {len(response.content)}")
+                out.write(f"        Status: {response.status_code}")
+                out.write(f"        Requested: bytes={start_point}-{end_point}")
+                out.write(f"        Content-Range: {response.headers.get('Content-Range', 'N/A')}")
+                out.write(f"        Bytes received: {received}")
             if response.status_code in (200, 206):
-                print(f"        {colorize('✓ OK', Colors.GREEN)}")
+                out.write(f"        {colorize('✓ OK', Colors.GREEN)}")
             else:
-                print(f"        {colorize(f'⚠ Status {response.status_code}', Colors.YELLOW)}")
+                out.write(f"        {colorize(f'⚠ Status {response.status_code}', Colors.YELLOW)}")
         except Exception as e:
-            print(f"        {colorize(f'✗ Failed: {e}', Colors.RED)}")
+            out.write(f"        {colorize(f'✗ Failed: {e}', Colors.RED)}")
     else:
-        print(f"  {colorize('[4/4]', Colors.CYAN)} GET range request (end of file)...")
-        print(f"        {colorize('○ Skipped (file too small or unknown length)', Colors.GRAY)}")
+        out.write(f"  {colorize('[4/4]', Colors.CYAN)} GET range request (end of file)...")
+        out.write(f"        {colorize('○ Skipped (file too small or unknown length)', Colors.GRAY)}")
+
+    out.flush()
 
 
 def run_listing(host: str, port: int, timeout: float, max_items: int, no_color: bool) -> NoReturn:
     """List the media library tree."""
-    from .tester import MediaItem
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+
+    from .tester import DLNATester
 
     print_header("DLNA Media Library Listing")
     print(f"Server: {colorize(f'{host}:{port}', Colors.BOLD)}")
 
     try:
-        with DLNATester(host, port, timeout) as tester:
+        with DLNATester(host, port, timeout, cache_browse=True) as tester:
             # Get device info
             device = tester.fetch_device_description()
             if device:
@@ -388,9 +562,7 @@ def run_listing(host: str, port: int, timeout: float, max_items: int, no_color:
                 print(colorize("Error: ContentDirectory service not available", Colors.RED))
                 sys.exit(1)
 
-            # Track counts
-            total_containers = 0
-            total_items = 0
+            out = LineBuffer()
 
             def print_item(item: MediaItem, indent: int = 0) -> None:
                 """Print a single item with appropriate formatting."""
@@ -399,17 +571,9 @@ def run_listing(host: str, port: int, timeout: float, max_items: int, no_color:
                     icon = "📁"
                     name = colorize(item.title, Colors.BLUE + Colors.BOLD)
                     count_str = f" ({item.child_count} items)" if item.child_count is not None else ""
-                    print(f"{prefix}{icon} {name}{colorize(count_str, Colors.GRAY)}")
+                    out.write(f"{prefix}{icon} {name}{colorize(count_str, Colors.GRAY)}")
                 else:
-                    # Determine icon based on class
-                    if "audioItem" in item.item_class:
-                        icon = "🎵"
-                    elif "videoItem" in item.item_class:
-                        icon = "🎬"
-                    elif "imageItem" in item.item_class:
-                        icon = "🖼️ "
-                    else:
-                        icon = "📄"
+                    icon = item_icon(item.item_class)
 
                     # Get duration if available
                     duration_str = ""
@@ -418,37 +582,101 @@ def run_listing(host: str, port: int, timeout: float, max_items: int, no_color:
                         if dur:
                             duration_str = colorize(f" [{dur}]", Colors.GRAY)
 
-                    print(f"{prefix}{icon} {item.title}{duration_str}")
+                    out.write(f"{prefix}{icon} {item.title}{duration_str}")
+
+            # Containers are browsed by a worker pool that queues each
+            # container's sub-containers as soon as its own response arrives,
+            # so the tree is fetched breadth-first and in parallel. Printing
+            # stays on this thread, in tree order, and streams as soon as the
+            # next container in that order is available.
+            executor = ThreadPoolExecutor(max_workers=BROWSE_WORKERS)
+            lock = threading.Lock()
+            prefetched: dict[str, Future] = {}
+            requested: set[str] = set()
+            discovered = 0
+            stopped = False
+
+            def browse_and_prefetch(object_id: str) -> tuple[list[MediaItem], int, int] | None:
+                """Browse a container and queue Browse requests for its sub-containers."""
+                nonlocal discovered
+                result = tester.browse(object_id, "BrowseDirectChildren", "*", 0, 0)
+                if result is None:
+                    return None
+
+                # Stop queueing work once max_items nodes have been seen
+                with lock:
+                    for item in result[0]:
+                        if stopped or discovered >= max_items:
+                            break
+                        discovered += 1
+                        if item.is_container and item.id not in requested:
+                            requested.add(item.id)
+                            prefetched[item.id] = executor.submit(browse_and_prefetch, item.id)
+                return result
+
+            def fetch_children(object_id: str) -> list[MediaItem] | None:
+                """Get the children of a container, using a prefetched result if available."""
+                with lock:
+                    future = prefetched.pop(object_id, None)
+                # Emit what we have before blocking on the network
+                if future is None or not future.done():
+                    out.flush()
+                if future is not None:
+                    result = future.result()
+                else:
+                    result = browse_and_prefetch(object_id)
+                return result[0] if result is not None else None
 
-            def browse_recursive(object_id: str, indent: int = 0) -> None:
-                """Recursively browse and print the tree."""
-                nonlocal total_containers, total_items
+            def browse_tree(root_id: str) -> tuple[int, int]:
+                """Walk and print the tree depth-first using an explicit stack.
 
-                if total_containers + total_items >= max_items:
-                    return
+                Each stack entry holds the remaining children of an open
+                container, so deep libraries don't run into the recursion limit.
 
-                result = tester.browse(object_id, "BrowseDirectChildren", "*", 0, 0)
-                if result is None:
-                    return
+                Returns:
+                    Tuple of (containers printed, items printed)
+                """
+                containers = 0
+                items = 0
 
-                items, num_returned, total_matches = result
+                root_items = fetch_children(root_id)
+                if not root_items:
+                    return containers, items
 
-                for item in items:
-                    if total_containers + total_items >= max_items:
-                        print(f"{'  ' * indent}... (max items limit reached)")
-                        return
+                stack: list[tuple[Iterator[MediaItem], int]] = [(iter(root_items), 0)]
+                while stack:
+                    children, indent = stack[-1]
+                    item = next(children, None)
+                    if item is None:
+                        stack.pop()
+                        continue
+
+                    if containers + items >= max_items:
+                        out.write(f"{'  ' * indent}... (max items limit reached)")
+                        break
 
                     print_item(item, indent)
 
                     if item.is_container:
-                        total_containers += 1
-                        browse_recursive(item.id, indent + 1)
+                        containers += 1
+                        if containers + items < max_items:
+                            sub_items = fetch_children(item.id)
+                            if sub_items:
+                                stack.append((iter(sub_items), indent + 1))
                     else:
-                        total_items += 1
+                        items += 1
+
+                return containers, items
 
             print(colorize("Media Library:", Colors.BOLD))
             print()
-            browse_recursive("0")
+            try:
+                total_containers, total_items = browse_tree("0")
+            finally:
+                with lock:
+                    stopped = True
+                executor.shutdown(wait=False, cancel_futures=True)
+                out.flush()
 
             print()
             print(colorize(f"Total: {total_containers} folders, {total_items} files", Colors.CYAN))
@@ -463,11 +691,51 @@ def run_listing(host: str, port: int, timeout: float, max_items: int, no_color:
         sys.exit(2)
 
 
+def result_to_json(obj: Any) -> dict[str, Any]:
+    """JSON encoder hook that serializes TestResult objects."""
+    # Duck-typed so the per-object hook doesn't re-run an import each call
+    to_dict = getattr(obj, "to_dict", None)
+    if to_dict is not None:
+        return to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def write_json(obj: Any) -> None:
+    """Write an indented JSON document to stdout, using orjson if installed."""
+    try:
+        import orjson
+    except ImportError:  # Optional; the stdlib encoder is used instead
+        orjson = None
+
+    if orjson is not None:
+        sys.stdout.flush()
+        sys.stdout.buffer.write(
+            orjson.dumps(
+                obj,
+                default=result_to_json,
+                # Non-str keys are stringified like the stdlib encoder does, and
+                # dataclasses go through to_dict() so both encoders agree
+                option=(
+                    orjson.OPT_INDENT_2
+                    | orjson.OPT_APPEND_NEWLINE
+                    | orjson.OPT_NON_STR_KEYS
+                    | orjson.OPT_PASSTHROUGH_DATACLASS
+                ),
+            )
+        )
+    else:
+        import json
+
+        json.dump(obj, sys.stdout, indent=2, default=result_to_json)
+        sys.stdout.write("\n")
+
+
 def run_json_output(
     host: str, port: int, timeout: float, verbose: bool, full_scan: bool, max_items: int
 ) -> NoReturn:
     """Run tests and output results as JSON."""
-    import json
+    from .tester import DLNATester
+    from .tests import TestSuite
 
     try:
         with DLNATester(host, port, timeout) as tester:
@@ -475,22 +743,12 @@ def run_json_output(
             suite.run_all_tests()
 
             summary = suite.get_summary()
-            results = [
-                {
-                    "name": r.name,
-                    "category": r.category.value,
-                    "status": r.status.value,
-                    "message": r.message,
-                    "details": r.details,
-                    "weight": r.weight,
-                }
-                for r in suite.results
-            ]
 
+            # Results are converted one at a time by the encoder's default hook
             output = {
                 "server": {"host": host, "port": port},
                 "summary": summary,
-                "results": results,
+                "results": suite.results,
             }
 
             if tester.device_info:
@@ -501,10 +759,12 @@ def run_json_output(
                     "device_type": tester.device_info.device_type,
                 }
 
-            print(json.dumps(output, indent=2))
+            write_json(output)
             sys.exit(0 if summary["failed"] == 0 else 1)
 
     except Exception as e:
+        import json
+
         print(json.dumps({"error": str(e)}))
         sys.exit(2)
 
@@ -513,6 +773,9 @@ def run_interactive(
     host: str, port: int, timeout: float, verbose: bool, full_scan: bool, max_items: int
 ) -> NoReturn:
     """Run tests with interactive output."""
+    from .tester import DLNATester
+    from .tests import CATEGORY_INDEX, CATEGORY_ORDER, TestCategory, TestStatus, TestSuite
+
     print_header("DLNA/UPnP Media Server Compliance Tester")
     print(f"Target: {colorize(f'{host}:{port}', Colors.BOLD)}")
     print(f"Timeout: {timeout}s")
@@ -528,64 +791,83 @@ def run_interactive(
             if verbose:
                 print()
 
-            results = suite.run_all_tests()
-
-            # Print device info if available
-            if tester.device_info:
-                print_subheader("Device Information")
-                info = tester.device_info
-                print(f"  Name:         {colorize(info.friendly_name, Colors.BOLD)}")
-                print(f"  Manufacturer: {info.manufacturer}")
-                print(f"  Model:        {info.model_name}")
-                print(f"  Type:         {info.device_type}")
-                if info.serial_number:
-                    print(f"  Serial:       {info.serial_number}")
-
-            # Group results by category
-            by_category: dict[TestCategory, list] = {}
-            for r in results:
-                if r.category not in by_category:
-                    by_category[r.category] = []
-                by_category[r.category].append(r)
-
-            # Print results by category
-            print_subheader("Test Results")
-
-            for category in TestCategory:
-                if category not in by_category:
-                    continue
-
-                cat_results = by_category[category]
-                passed = sum(1 for r in cat_results if r.status == TestStatus.PASS)
-                total = len(cat_results)
+            # Results are rendered through one buffer, flushed per section
+            out = LineBuffer()
+
+            # Key row prefixes by enum member to skip .value lookups per row
+            row_prefixes = {status: _ROW_PREFIXES[status.value] for status in TestStatus}
+            detail_line = _BANNERS["detail"]
+
+            # Results grouped by category, with passes tallied as they arrive
+            by_category: defaultdict[TestCategory, list] = defaultdict(list)
+            passed_by_category: Counter[TestCategory] = Counter()
+
+            # Device info is only complete once the suite is past this category
+            first_render = CATEGORY_INDEX[TestCategory.DEVICE_DESCRIPTION] + 1
+            rendered = 0  # Number of CATEGORY_ORDER entries printed so far
+
+            def render_until(stop: int) -> None:
+                """Print the CATEGORY_ORDER entries before stop not yet printed."""
+                nonlocal rendered
+
+                if rendered == 0:
+                    # Print device info if available
+                    if tester.device_info:
+                        print_subheader("Device Information", out)
+                        info = tester.device_info
+                        out.write(f"  Name:         {colorize(info.friendly_name, Colors.BOLD)}")
+                        out.write(f"  Manufacturer: {info.manufacturer}")
+                        out.write(f"  Model:        {info.model_name}")
+                        out.write(f"  Type:         {info.device_type}")
+                        if info.serial_number:
+                            out.write(f"  Serial:       {info.serial_number}")
+                        out.flush()
+
+                    print_subheader("Test Results", out)
+
+                for category in CATEGORY_ORDER[rendered:stop]:
+                    cat_results = by_category.get(category)
+                    if not cat_results:
+                        continue
+
+                    passed = passed_by_category[category]
+                    total = len(cat_results)
+
+                    out.write()
+                    out.write(
+                        f"  {colorize(category.value, Colors.BOLD)} "
+                        f"({passed}/{total} passed)"
+                    )
 
-                print()
-                print(
-                    f"  {colorize(category.value, Colors.BOLD)} "
-                    f"({passed}/{total} passed)"
-                )
+                    for r in cat_results:
+                        out.write(row_prefixes[r.status] + r.name)
+                        if verbose or r.status is TestStatus.FAIL or r.status is TestStatus.WARN:
+                            out.write(detail_line % truncate(r.message, 60))
 
-                for r in cat_results:
-                    icon = status_icon(r.status)
-                    color = status_color(r.status)
-                    status_str = colorize(f"[{r.status.value}]", color)
-                    icon_str = colorize(icon, color)
+                    out.flush()
 
-                    # Truncate long messages
-                    msg = r.message
-                    if len(msg) > 60:
-                        msg = msg[:57] + "..."
+                rendered = stop
 
-                    print(f"    {icon_str} {status_str} {r.name}")
-                    if verbose or r.status in (TestStatus.FAIL, TestStatus.WARN):
-                        print(f"      {colorize(msg, Colors.GRAY)}")
+            # Without -v, each category is printed as soon as the suite moves
+            # past it; with -v the suite logs as it goes, so results wait
+            # until the end to keep that log contiguous.
+            for r in suite.run_all_tests_iter():
+                by_category[r.category].append(r)
+                if r.status is TestStatus.PASS:
+                    passed_by_category[r.category] += 1
+                if not verbose:
+                    index = CATEGORY_INDEX[r.category]
+                    if index >= first_render and index > rendered:
+                        render_until(index)
+            render_until(len(CATEGORY_ORDER))
+            results = suite.results
 
             # Print summary
             summary = suite.get_summary()
             score, max_score, grade = suite.get_score()
             percentage = (score / max_score * 100) if max_score > 0 else 0
 
-            print_header("Compliance Summary")
+            print_header("Compliance Summary", out)
 
             # Stats line
             stats = []
@@ -598,41 +880,41 @@ def run_interactive(
             if summary["skipped"]:
                 stats.append(colorize(f"{summary['skipped']} skipped", Colors.GRAY))
 
-            print(f"  Tests: {', '.join(stats)}")
-            print(f"  Score: {score:.1f}/{max_score:.1f} ({percentage:.1f}%)")
+            out.write(f"  Tests: {', '.join(stats)}")
+            out.write(f"  Score: {score:.1f}/{max_score:.1f} ({percentage:.1f}%)")
 
             # Grade display
             grade_str = colorize(grade, Colors.BOLD + grade_color(grade))
-            print()
-            print(f"  ╔═══════════════════╗")
-            print(f"  ║   GRADE: {grade_str}       ║")
-            print(f"  ╚═══════════════════╝")
+            out.write()
+            out.write(_GRADE_BOX_TOP)
+            out.write(_GRADE_BOX_MID % grade_str)
+            out.write(_GRADE_BOX_BOT)
 
             # Grade interpretation
-            print()
+            out.write()
             if grade.startswith("A"):
-                print(
+                out.write(
                     colorize(
                         "  Excellent! This server has strong DLNA compliance.",
                         Colors.GREEN,
                     )
                 )
             elif grade.startswith("B"):
-                print(
+                out.write(
                     colorize(
                         "  Good compliance with minor issues.",
                         Colors.CYAN,
                     )
                 )
             elif grade.startswith("C"):
-                print(
+                out.write(
                     colorize(
                         "  Acceptable compliance but with notable issues.",
                         Colors.YELLOW,
                     )
                 )
             else:
-                print(
+                out.write(
                     colorize(
                         "  Poor compliance. Major issues detected.",
                         Colors.RED,
@@ -641,15 +923,16 @@ def run_interactive(
 
             # Show critical failures
             critical_failures = [
-                r for r in results if r.status == TestStatus.FAIL and r.weight >= 1.5
+                r for r in results if r.status is TestStatus.FAIL and r.weight >= 1.5
             ]
             if critical_failures:
-                print()
-                print(colorize("  Critical issues:", Colors.RED + Colors.BOLD))
+                out.write()
+                out.write(colorize("  Critical issues:", Colors.RED + Colors.BOLD))
                 for r in critical_failures:
-                    print(f"    • {r.name}: {r.message}")
+                    out.write(f"    • {r.name}: {r.message}")
 
-            print()
+            out.write()
+            out.flush()
             sys.exit(0 if summary["failed"] == 0 else 1)
 
     except KeyboardInterrupt:
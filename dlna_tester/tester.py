@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import functools
 import html
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import Any
 from urllib.parse import urljoin, urlparse
@@ -21,8 +24,192 @@ NS = {
     "dlna": "urn:schemas-dlna-org:metadata-1-0/",
 }
 
+USER_AGENT = "DLNA-Tester/1.0 UPnP/1.0"
+
+# All requests go to a single server, so keep connections alive between
+# calls; eight covers the CLI's concurrent Browse workers.
+CONNECTION_LIMITS = httpx.Limits(
+    max_keepalive_connections=8, max_connections=16, keepalive_expiry=30.0
+)
+
+
+# DIDL-Lite <res> attributes kept on MediaItem resources, as (key, attribute)
+RES_ATTRIBUTES = (
+    ("protocol_info", "protocolInfo"),
+    ("size", "size"),
+    ("duration", "duration"),
+    ("bitrate", "bitrate"),
+    ("sample_frequency", "sampleFrequency"),
+    ("bits_per_sample", "bitsPerSample"),
+    ("nr_audio_channels", "nrAudioChannels"),
+    ("resolution", "resolution"),
+    ("color_depth", "colorDepth"),
+)
+_RES_KEYS = {attr: key for key, attr in RES_ATTRIBUTES}
+
+# Namespaces that SOAP response arguments may be qualified with
+CONTENT_DIRECTORY_TYPE = "urn:schemas-upnp-org:service:ContentDirectory:1"
+CONNECTION_MANAGER_TYPE = "urn:schemas-upnp-org:service:ConnectionManager:1"
+
+DIDL_CONTAINER_TAG = f"{{{NS['didl']}}}container"
+DIDL_ITEM_TAG = f"{{{NS['didl']}}}item"
+DIDL_RES_TAG = f"{{{NS['didl']}}}res"
+DC_TITLE_TAG = f"{{{NS['dc']}}}title"
+UPNP_CLASS_TAG = f"{{{NS['upnp_meta']}}}class"
+# Characters of DIDL-Lite handed to the pull parser at a time
+DIDL_FEED_SIZE = 64 * 1024
+
+# Optional DIDL-Lite elements copied into MediaItem.metadata, as (key, tag)
+METADATA_TAGS = tuple(
+    [
+        (name, f"{{{NS['dc']}}}{name}")
+        for name in ("creator", "date", "description", "publisher", "rights")
+    ]
+    + [
+        (name, f"{{{NS['upnp_meta']}}}{name}")
+        for name in (
+            "artist",
+            "album",
+            "genre",
+            "albumArtURI",
+            "originalTrackNumber",
+            "playbackCount",
+            "lastPlaybackTime",
+            "rating",
+        )
+    ]
+)
+# Single-valued child elements read by _parse_didl_item, by tag
+_FIELD_KEYS = {
+    DC_TITLE_TAG: "title",
+    UPNP_CLASS_TAG: "class",
+    **{tag: key for key, tag in METADATA_TAGS},
+}
+
+# SOAP request envelope; filled with (action, service type, arguments, action)
+SOAP_ENVELOPE = (
+    '<?xml version="1.0" encoding="utf-8"?>'
+    '<s:Envelope xmlns:s="http://schemas.xmlsoap.org/soap/envelope/"'
+    ' s:encodingStyle="http://schemas.xmlsoap.org/soap/encoding/">'
+    '<s:Body><u:%s xmlns:u="%s">%s</u:%s></s:Body></s:Envelope>'
+)
+
+
+@functools.lru_cache(maxsize=64)
+def _soap_headers(service_type: str, action: str) -> dict[str, str]:
+    """Return the request headers for a SOAP action (shared; don't modify)."""
+    return {
+        "Content-Type": 'text/xml; charset="utf-8"',
+        "SOAPAction": f'"{service_type}#{action}"',
+    }
+
+
+@functools.lru_cache(maxsize=64)
+def _response_arg_xpaths(service_type: str, name: str) -> tuple[etree.XPath, etree.XPath]:
+    """Return compiled (namespaced, unqualified) lookups for a SOAP response argument."""
+    return (
+        etree.XPath(f".//svc:{name}", namespaces={"svc": service_type}),
+        etree.XPath(f".//{name}"),
+    )
 
-@dataclass
+
+_parser_local = threading.local()
+
+
+def _parser() -> etree.XMLParser:
+    """Return this thread's reusable XML parser.
+
+    Reusing a parser saves setting one up per document, but lxml serializes
+    parses that share one, so each thread (e.g. Browse workers) gets its own.
+    Entity expansion and ID collection aren't needed for UPnP documents.
+    """
+    parser = getattr(_parser_local, "parser", None)
+    if parser is None:
+        parser = _parser_local.parser = etree.XMLParser(
+            resolve_entities=False, collect_ids=False
+        )
+    return parser
+
+
+def _didl_parser() -> etree.XMLPullParser:
+    """Return this thread's reusable DIDL-Lite pull parser.
+
+    It reports the end of each container and item, and like _parser() is
+    kept per thread so Browse workers don't wait on each other.
+    """
+    parser = getattr(_parser_local, "didl_parser", None)
+    if parser is None:
+        parser = _parser_local.didl_parser = etree.XMLPullParser(
+            events=("end",),
+            tag=(DIDL_CONTAINER_TAG, DIDL_ITEM_TAG),
+            resolve_entities=False,
+            collect_ids=False,
+        )
+    return parser
+
+
+def _unescape_didl(text: str) -> str:
+    """Undo one level of XML escaping on a double-escaped DIDL-Lite document.
+
+    Servers only escape the XML specials, so plain replaces (done in C) are
+    enough; numeric references are left for the XML parser. &amp; goes last
+    so "&amp;lt;" becomes "&lt;" rather than "<".
+    """
+    return (
+        text.replace("&lt;", "<")
+        .replace("&gt;", ">")
+        .replace("&quot;", '"')
+        .replace("&apos;", "'")
+        .replace("&amp;", "&")
+    )
+
+
+def _may_store(response: httpx.Response) -> bool:
+    """Return whether the server allows keeping response for reuse."""
+    return "no-store" not in response.headers.get("Cache-Control", "").lower()
+
+
+def _xpath(path: str) -> etree.XPath:
+    """Compile an XPath expression using the prefixes in NS."""
+    return etree.XPath(path, namespaces=NS)
+
+
+def _first(xpath: etree.XPath, elem: etree._Element) -> etree._Element | None:
+    """Return the first element matched by xpath, like elem.find()."""
+    matches = xpath(elem)
+    return matches[0] if matches else None
+
+
+# Paths compiled once rather than re-resolved on every lookup
+_XP_SOAP_BODY = _xpath(".//soap:Body")
+_XP_DEVICE = _xpath(".//upnp:device")
+_XP_SERVICES = _xpath("upnp:serviceList[1]/upnp:service")
+_XP_ICONS = _xpath("upnp:iconList[1]/upnp:icon")
+_XP_ACTIONS = _xpath("(.//service:actionList)[1]/service:action")
+_XP_STATE_VARIABLES = _xpath("(.//service:serviceStateTable)[1]/service:stateVariable")
+_XP_NAME = _xpath("service:name")
+_XP_DATA_TYPE = _xpath("service:dataType")
+
+# Common paths for the device description, in the order they are preferred
+DESCRIPTION_PATHS = (
+    "/DeviceDescription.xml",
+    "/description.xml",
+    "/rootDesc.xml",
+    "/device.xml",
+    "/MediaServer.xml",
+    "/dmr.xml",
+    "/upnp/desc.xml",
+    "/dlna/device.xml",
+    "/",
+)
+
+# A device description declares this namespace near the top of the document,
+# so probes stop reading a candidate once this much has arrived without it
+DEVICE_MARKER = b"urn:schemas-upnp-org:device"
+DESCRIPTION_PROBE_LIMIT = 64 * 1024
+
+
+@dataclass(slots=True)
 class ServiceInfo:
     """Information about a UPnP service."""
 
@@ -33,9 +220,11 @@ class ServiceInfo:
     event_sub_url: str
     actions: list[str] = field(default_factory=list)
     state_variables: list[dict[str, Any]] = field(default_factory=list)
+    # Set once the SCPD has been parsed into actions/state_variables
+    scpd_loaded: bool = field(default=False, repr=False, compare=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceInfo:
     """Information about a UPnP device."""
 
@@ -54,7 +243,7 @@ class DeviceInfo:
     icons: list[dict[str, Any]] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class MediaItem:
     """Represents a media item from DIDL-Lite."""
 
@@ -72,23 +261,44 @@ class MediaItem:
 class DLNATester:
     """DLNA/UPnP Media Server compliance tester."""
 
-    def __init__(self, host: str, port: int, timeout: float = 10.0):
+    def __init__(
+        self, host: str, port: int, timeout: float = 10.0, cache_browse: bool = False
+    ):
         """Initialize the tester with server address.
 
         Args:
             host: Server IP address or hostname
             port: Server port number
             timeout: Request timeout in seconds
+            cache_browse: Reuse successful Browse results for repeated requests.
+                Cached item lists are shared, so callers must not modify them.
         """
         self.host = host
         self.port = port
         self.base_url = f"http://{host}:{port}"
         self.timeout = timeout
-        self.client = httpx.Client(timeout=timeout)
+        # Retrying once recovers from a connect failure on a fresh socket
+        self.client = httpx.Client(
+            timeout=timeout,
+            headers={"User-Agent": USER_AGENT},
+            transport=httpx.HTTPTransport(limits=CONNECTION_LIMITS, retries=1),
+        )
         self.device_info: DeviceInfo | None = None
         self._device_description_url: str | None = None
+        # Response the device description was last parsed from
+        self._device_description_response: httpx.Response | None = None
         self._content_directory: ServiceInfo | None = None
         self._connection_manager: ServiceInfo | None = None
+        # Whether SOAP response arguments were last found unqualified
+        self._bare_response_args = False
+        self._browse_cache: dict[tuple[Any, ...], tuple[list[MediaItem], int, int]] | None = (
+            {} if cache_browse else None
+        )
+        # Successful results of actions whose answer is fixed for the device
+        # (capabilities, protocol info); SystemUpdateID is deliberately absent
+        self._action_cache: dict[str, Any] = {}
+        # Successful resource probes keyed by (method, absolute URL)
+        self._resource_cache: dict[tuple[str, str], Any] = {}
 
     def close(self) -> None:
         """Close the HTTP client."""
@@ -124,70 +334,67 @@ class DLNATester:
         Returns:
             The parsed XML response body element, or None on error
         """
-        arguments = arguments or {}
-
         # Build SOAP envelope
         args_xml = "".join(
-            f"<{name}>{html.escape(str(value))}</{name}>"
-            for name, value in arguments.items()
+            [
+                f"<{name}>{html.escape(str(value), quote=False)}</{name}>"
+                for name, value in (arguments or {}).items()
+            ]
         )
-
-        soap_body = f"""<?xml version="1.0" encoding="utf-8"?>
-<s:Envelope xmlns:s="http://schemas.xmlsoap.org/soap/envelope/"
-            s:encodingStyle="http://schemas.xmlsoap.org/soap/encoding/">
-    <s:Body>
-        <u:{action} xmlns:u="{service_type}">
-            {args_xml}
-        </u:{action}>
-    </s:Body>
-</s:Envelope>"""
-
-        headers = {
-            "Content-Type": 'text/xml; charset="utf-8"',
-            "SOAPAction": f'"{service_type}#{action}"',
-            "User-Agent": "DLNA-Tester/1.0 UPnP/1.0",
-        }
+        soap_body = (SOAP_ENVELOPE % (action, service_type, args_xml, action)).encode("utf-8")
 
         url = self._make_url(control_url)
         try:
-            response = self.client.post(url, content=soap_body, headers=headers)
+            response = self.client.post(
+                url, content=soap_body, headers=_soap_headers(service_type, action)
+            )
             response.raise_for_status()
-            root = etree.fromstring(response.content)
-            body = root.find(".//soap:Body", NS)
-            return body
+            root = etree.fromstring(response.content, _parser())
+            return _first(_XP_SOAP_BODY, root)
         except Exception:
             return None
 
+    def _is_device_description(self, url: str) -> bool:
+        """Check whether url serves a UPnP device description.
+
+        The body is streamed and only read until the device namespace shows
+        up, so misses and large non-XML pages (e.g. a web UI at "/") cost
+        little more than the status line.
+        """
+        try:
+            with self.client.stream("GET", url) as response:
+                if response.status_code != 200:
+                    return False
+                seen = b""
+                for chunk in response.iter_bytes():
+                    # Keep a short tail so a marker split across chunks is found
+                    seen = seen[-len(DEVICE_MARKER):] + chunk
+                    if DEVICE_MARKER in seen:
+                        return True
+                    if response.num_bytes_downloaded >= DESCRIPTION_PROBE_LIMIT:
+                        break
+        except Exception:
+            pass
+        return False
+
     def discover_device_description(self) -> str | None:
         """Try to find the device description URL.
 
         Returns:
             The device description URL if found, None otherwise
         """
-        # Common paths for device description
-        common_paths = [
-            "/DeviceDescription.xml",
-            "/description.xml",
-            "/rootDesc.xml",
-            "/device.xml",
-            "/MediaServer.xml",
-            "/dmr.xml",
-            "/upnp/desc.xml",
-            "/dlna/device.xml",
-            "/",
-        ]
-
-        for path in common_paths:
-            url = self._make_url(path)
-            try:
-                response = self.client.get(url)
-                if response.status_code == 200:
-                    content = response.text
-                    if "urn:schemas-upnp-org:device" in content:
-                        self._device_description_url = url
-                        return url
-            except Exception:
-                continue
+        # Probe every common path at once, but take the first match in list
+        # order so the result is the same as trying them one by one
+        urls = [self._make_url(path) for path in DESCRIPTION_PATHS]
+        executor = ThreadPoolExecutor(max_workers=len(urls))
+        try:
+            futures = [executor.submit(self._is_device_description, url) for url in urls]
+            for url, future in zip(urls, futures):
+                if future.result():
+                    self._device_description_url = url
+                    return url
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
 
         return None
 
@@ -210,11 +417,12 @@ class DLNATester:
         try:
             response = self.client.get(url)
             response.raise_for_status()
-            root = etree.fromstring(response.content)
+            root = etree.fromstring(response.content, _parser())
         except Exception:
             return None
+        self._device_description_response = response
 
-        device = root.find(".//upnp:device", NS)
+        device = _first(_XP_DEVICE, root)
         if device is None:
             return None
 
@@ -228,31 +436,27 @@ class DLNATester:
 
         # Parse services
         services: list[ServiceInfo] = []
-        service_list = device.find("upnp:serviceList", NS)
-        if service_list is not None:
-            for service_elem in service_list.findall("upnp:service", NS):
-                service = ServiceInfo(
-                    service_type=get_text(service_elem, "serviceType"),
-                    service_id=get_text(service_elem, "serviceId"),
-                    scpd_url=get_text(service_elem, "SCPDURL"),
-                    control_url=get_text(service_elem, "controlURL"),
-                    event_sub_url=get_text(service_elem, "eventSubURL"),
-                )
-                services.append(service)
+        for service_elem in _XP_SERVICES(device):
+            service = ServiceInfo(
+                service_type=get_text(service_elem, "serviceType"),
+                service_id=get_text(service_elem, "serviceId"),
+                scpd_url=get_text(service_elem, "SCPDURL"),
+                control_url=get_text(service_elem, "controlURL"),
+                event_sub_url=get_text(service_elem, "eventSubURL"),
+            )
+            services.append(service)
 
         # Parse icons
         icons: list[dict[str, Any]] = []
-        icon_list = device.find("upnp:iconList", NS)
-        if icon_list is not None:
-            for icon_elem in icon_list.findall("upnp:icon", NS):
-                icon = {
-                    "mimetype": get_text(icon_elem, "mimetype"),
-                    "width": get_text(icon_elem, "width"),
-                    "height": get_text(icon_elem, "height"),
-                    "depth": get_text(icon_elem, "depth"),
-                    "url": get_text(icon_elem, "url"),
-                }
-                icons.append(icon)
+        for icon_elem in _XP_ICONS(device):
+            icon = {
+                "mimetype": get_text(icon_elem, "mimetype"),
+                "width": get_text(icon_elem, "width"),
+                "height": get_text(icon_elem, "height"),
+                "depth": get_text(icon_elem, "depth"),
+                "url": get_text(icon_elem, "url"),
+            }
+            icons.append(icon)
 
         self.device_info = DeviceInfo(
             device_type=get_text(device, "deviceType"),
@@ -285,39 +489,41 @@ class DLNATester:
         Args:
             service: The service to fetch description for
 
+        An SCPD that was already loaded into service is not fetched again.
+
         Returns:
             True if successful, False otherwise
         """
+        if service.scpd_loaded:
+            return True
+
         url = self._make_url(service.scpd_url)
         try:
             response = self.client.get(url)
             response.raise_for_status()
-            root = etree.fromstring(response.content)
+            root = etree.fromstring(response.content, _parser())
         except Exception:
             return False
 
         # Parse actions
-        action_list = root.find(".//service:actionList", NS)
-        if action_list is not None:
-            for action_elem in action_list.findall("service:action", NS):
-                name_elem = action_elem.find("service:name", NS)
-                if name_elem is not None and name_elem.text:
-                    service.actions.append(name_elem.text)
+        for action_elem in _XP_ACTIONS(root):
+            name_elem = _first(_XP_NAME, action_elem)
+            if name_elem is not None and name_elem.text:
+                service.actions.append(name_elem.text)
 
         # Parse state variables
-        state_table = root.find(".//service:serviceStateTable", NS)
-        if state_table is not None:
-            for var_elem in state_table.findall("service:stateVariable", NS):
-                name_elem = var_elem.find("service:name", NS)
-                type_elem = var_elem.find("service:dataType", NS)
-                if name_elem is not None:
-                    var_info = {
-                        "name": name_elem.text,
-                        "data_type": type_elem.text if type_elem is not None else None,
-                        "send_events": var_elem.get("sendEvents", "yes"),
-                    }
-                    service.state_variables.append(var_info)
+        for var_elem in _XP_STATE_VARIABLES(root):
+            name_elem = _first(_XP_NAME, var_elem)
+            type_elem = _first(_XP_DATA_TYPE, var_elem)
+            if name_elem is not None:
+                var_info = {
+                    "name": name_elem.text,
+                    "data_type": type_elem.text if type_elem is not None else None,
+                    "send_events": var_elem.get("sendEvents", "yes"),
+                }
+                service.state_variables.append(var_info)
 
+        service.scpd_loaded = True
         return True
 
     def get_search_capabilities(self) -> str | None:
@@ -328,6 +534,9 @@ class DLNATester:
         """
         if self._content_directory is None:
             return None
+        cached = self._action_cache.get("GetSearchCapabilities")
+        if cached is not None:
+            return cached
 
         body = self._soap_request(
             self._content_directory.control_url,
@@ -337,11 +546,11 @@ class DLNATester:
         if body is None:
             return None
 
-        result = body.find(".//{urn:schemas-upnp-org:service:ContentDirectory:1}SearchCaps")
-        if result is None:
-            # Try without namespace
-            result = body.find(".//SearchCaps")
-        return result.text if result is not None else ""
+        result = self._find_response_arg(body, CONTENT_DIRECTORY_TYPE, "SearchCaps")
+        caps = result.text if result is not None else ""
+        if caps is not None:
+            self._action_cache["GetSearchCapabilities"] = caps
+        return caps
 
     def get_sort_capabilities(self) -> str | None:
         """Get the sort capabilities of the Content Directory service.
@@ -351,6 +560,9 @@ class DLNATester:
         """
         if self._content_directory is None:
             return None
+        cached = self._action_cache.get("GetSortCapabilities")
+        if cached is not None:
+            return cached
 
         body = self._soap_request(
             self._content_directory.control_url,
@@ -360,14 +572,19 @@ class DLNATester:
         if body is None:
             return None
 
-        result = body.find(".//{urn:schemas-upnp-org:service:ContentDirectory:1}SortCaps")
-        if result is None:
-            result = body.find(".//SortCaps")
-        return result.text if result is not None else ""
+        result = self._find_response_arg(body, CONTENT_DIRECTORY_TYPE, "SortCaps")
+        caps = result.text if result is not None else ""
+        if caps is not None:
+            self._action_cache["GetSortCapabilities"] = caps
+        return caps
 
     def get_system_update_id(self) -> int | None:
         """Get the system update ID from the Content Directory service.
 
+        Unlike the capability queries this is never cached, since the ID
+        changes with the library. It only uses the shared client and the
+        per-thread parser, so concurrent calls are safe.
+
         Returns:
             The system update ID, or None on error
         """
@@ -382,9 +599,7 @@ class DLNATester:
         if body is None:
             return None
 
-        result = body.find(".//{urn:schemas-upnp-org:service:ContentDirectory:1}Id")
-        if result is None:
-            result = body.find(".//Id")
+        result = self._find_response_arg(body, CONTENT_DIRECTORY_TYPE, "Id")
         try:
             return int(result.text) if result is not None and result.text else None
         except ValueError:
@@ -398,6 +613,9 @@ class DLNATester:
         """
         if self._connection_manager is None:
             return None, None
+        cached = self._action_cache.get("GetProtocolInfo")
+        if cached is not None:
+            return cached
 
         body = self._soap_request(
             self._connection_manager.control_url,
@@ -407,17 +625,15 @@ class DLNATester:
         if body is None:
             return None, None
 
-        source = body.find(".//{urn:schemas-upnp-org:service:ConnectionManager:1}Source")
-        if source is None:
-            source = body.find(".//Source")
-        sink = body.find(".//{urn:schemas-upnp-org:service:ConnectionManager:1}Sink")
-        if sink is None:
-            sink = body.find(".//Sink")
+        source = self._find_response_arg(body, CONNECTION_MANAGER_TYPE, "Source")
+        sink = self._find_response_arg(body, CONNECTION_MANAGER_TYPE, "Sink")
 
-        return (
+        protocol_info = (
             source.text if source is not None else None,
             sink.text if sink is not None else None,
         )
+        self._action_cache["GetProtocolInfo"] = protocol_info
+        return protocol_info
 
     def browse(
         self,
@@ -444,6 +660,14 @@ class DLNATester:
         if self._content_directory is None:
             return None
 
+        cache_key = (
+            object_id, browse_flag, filter_str, starting_index, requested_count, sort_criteria
+        )
+        if self._browse_cache is not None:
+            cached = self._browse_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
         body = self._soap_request(
             self._content_directory.control_url,
             self._content_directory.service_type,
@@ -460,22 +684,57 @@ class DLNATester:
         if body is None:
             return None
 
-        # Extract response values
-        ns = "{urn:schemas-upnp-org:service:ContentDirectory:1}"
-        result_elem = body.find(f".//{ns}Result")
-        if result_elem is None:
-            result_elem = body.find(".//Result")
+        parsed = self._parse_browse_response(body)
+        if parsed is None:
+            return [], 0, 0
+        if self._browse_cache is not None:
+            self._browse_cache[cache_key] = parsed
+        return parsed
+
+    def _find_response_arg(
+        self, body: etree._Element, service_type: str, name: str
+    ) -> etree._Element | None:
+        """Find an output argument in a SOAP response body.
+
+        Servers differ on whether response arguments are namespaced (most
+        leave them unqualified, as in the UPnP examples), so whichever form
+        matched last time is tried first.
 
-        num_returned_elem = body.find(f".//{ns}NumberReturned")
-        if num_returned_elem is None:
-            num_returned_elem = body.find(".//NumberReturned")
+        Args:
+            body: The SOAP Body element
+            service_type: The service type URN
+            name: The argument name
 
-        total_matches_elem = body.find(f".//{ns}TotalMatches")
-        if total_matches_elem is None:
-            total_matches_elem = body.find(".//TotalMatches")
+        Returns:
+            The argument element, or None if not present
+        """
+        qualified, bare = _response_arg_xpaths(service_type, name)
+        paths = (bare, qualified) if self._bare_response_args else (qualified, bare)
+        for path in paths:
+            found = _first(path, body)
+            if found is not None:
+                self._bare_response_args = path is bare
+                return found
+        return None
 
+    def _parse_browse_response(
+        self, body: etree._Element
+    ) -> tuple[list[MediaItem], int, int] | None:
+        """Extract the results of a Browse or Search response.
+
+        Args:
+            body: The SOAP Body element
+
+        Returns:
+            Tuple of (items, number_returned, total_matches), or None if the
+            response has no Result
+        """
+        service_type = CONTENT_DIRECTORY_TYPE
+        result_elem = self._find_response_arg(body, service_type, "Result")
         if result_elem is None or result_elem.text is None:
-            return [], 0, 0
+            return None
+        num_returned_elem = self._find_response_arg(body, service_type, "NumberReturned")
+        total_matches_elem = self._find_response_arg(body, service_type, "TotalMatches")
 
         try:
             number_returned = (
@@ -499,62 +758,109 @@ class DLNATester:
     def _parse_didl_lite(self, didl_text: str) -> list[MediaItem]:
         """Parse DIDL-Lite XML into MediaItem objects.
 
+        The document is fed to a pull parser in chunks and each container or
+        item is dropped from the tree once converted, so large Browse results
+        don't hold a full element tree alongside the MediaItems.
+
         Args:
             didl_text: The DIDL-Lite XML string
 
         Returns:
-            List of MediaItem objects
+            List of MediaItem objects, containers first
         """
+        containers: list[MediaItem] = []
         items: list[MediaItem] = []
 
         try:
             # Unescape HTML entities if needed
             if "&lt;" in didl_text:
-                didl_text = html.unescape(didl_text)
-
-            root = etree.fromstring(didl_text.encode("utf-8"))
+                didl_text = _unescape_didl(didl_text)
+
+            # Shared by all entries so repeated values are stored once
+            strings: dict[str, str] = {}
+            parser = _didl_parser()
+            for start in range(0, len(didl_text), DIDL_FEED_SIZE):
+                parser.feed(didl_text[start:start + DIDL_FEED_SIZE])
+                self._collect_didl_items(parser, containers, items, strings)
+            parser.close()
+            self._collect_didl_items(parser, containers, items, strings)
         except Exception:
-            return items
+            # Don't reuse a parser left mid-document or with queued events
+            _parser_local.didl_parser = None
+            return []
 
-        # Process containers
-        for container in root.findall(".//didl:container", NS):
-            item = self._parse_didl_item(container, is_container=True)
-            if item:
-                items.append(item)
+        return containers + items
 
-        # Process items
-        for item_elem in root.findall(".//didl:item", NS):
-            item = self._parse_didl_item(item_elem, is_container=False)
+    def _collect_didl_items(
+        self,
+        parser: etree.XMLPullParser,
+        containers: list[MediaItem],
+        items: list[MediaItem],
+        strings: dict[str, str],
+    ) -> None:
+        """Convert the containers and items the parser has finished so far.
+
+        Args:
+            parser: The DIDL-Lite pull parser
+            containers: List to append parsed containers to
+            items: List to append parsed items to
+            strings: Intern table passed on to _parse_didl_item
+        """
+        for _, elem in parser.read_events():
+            is_container = elem.tag == DIDL_CONTAINER_TAG
+            item = self._parse_didl_item(elem, is_container=is_container, strings=strings)
             if item:
-                items.append(item)
+                (containers if is_container else items).append(item)
 
-        return items
+            # Free the element, and for top-level entries the ones before it
+            # too (nested entries' siblings still belong to their parent)
+            elem.clear(keep_tail=True)
+            parent = elem.getparent()
+            if parent is not None and parent.getparent() is None:
+                while elem.getprevious() is not None:
+                    del parent[0]
 
     def _parse_didl_item(
-        self, elem: etree._Element, is_container: bool
+        self,
+        elem: etree._Element,
+        is_container: bool,
+        strings: dict[str, str] | None = None,
     ) -> MediaItem | None:
         """Parse a single DIDL-Lite item or container element.
 
         Args:
             elem: The XML element
             is_container: Whether this is a container
+            strings: Optional intern table; values that repeat across a result
+                (parent ID, class, protocolInfo) are replaced by the copy
+                already in it
 
         Returns:
             MediaItem or None on error
         """
+        intern = (strings if strings is not None else {}).setdefault
+
         item_id = elem.get("id", "")
         parent_id = elem.get("parentID", "")
+        parent_id = intern(parent_id, parent_id)
         restricted = elem.get("restricted", "1") == "1"
 
-        # Get title
-        title_elem = elem.find("dc:title", NS)
-        title = title_elem.text if title_elem is not None and title_elem.text else ""
-
-        # Get class
-        class_elem = elem.find("upnp_meta:class", NS)
-        item_class = (
-            class_elem.text if class_elem is not None and class_elem.text else ""
-        )
+        # Walk the children once, keeping every <res> and the text of the
+        # first of each other element of interest (as find() would)
+        texts: dict[str, str | None] = {}
+        res_elems: list[etree._Element] = []
+        for child in elem:
+            tag = child.tag
+            if tag == DIDL_RES_TAG:
+                res_elems.append(child)
+            else:
+                key = _FIELD_KEYS.get(tag)
+                if key is not None and key not in texts:
+                    texts[key] = child.text
+
+        title = texts.pop("title", None) or ""
+        item_class = texts.pop("class", None) or ""
+        item_class = intern(item_class, item_class)
 
         # Get child count for containers
         child_count = None
@@ -568,46 +874,21 @@ class DLNATester:
 
         # Parse resources
         resources: list[dict[str, Any]] = []
-        for res in elem.findall("didl:res", NS):
-            res_info: dict[str, Any] = {
-                "url": res.text,
-                "protocol_info": res.get("protocolInfo"),
-                "size": res.get("size"),
-                "duration": res.get("duration"),
-                "bitrate": res.get("bitrate"),
-                "sample_frequency": res.get("sampleFrequency"),
-                "bits_per_sample": res.get("bitsPerSample"),
-                "nr_audio_channels": res.get("nrAudioChannels"),
-                "resolution": res.get("resolution"),
-                "color_depth": res.get("colorDepth"),
-            }
-            # Remove None values
-            res_info = {k: v for k, v in res_info.items() if v is not None}
+        for res in res_elems:
+            # Only keys present on the element are set
+            res_info: dict[str, Any] = {} if res.text is None else {"url": res.text}
+            # One pass over the attributes present beats probing for each known one
+            for attr, value in res.items():
+                key = _RES_KEYS.get(attr)
+                if key is not None:
+                    res_info[key] = value
+            protocol_info = res_info.get("protocol_info")
+            if protocol_info is not None:
+                res_info["protocol_info"] = intern(protocol_info, protocol_info)
             resources.append(res_info)
 
-        # Parse additional metadata
-        metadata: dict[str, Any] = {}
-
-        # Common Dublin Core elements
-        for dc_elem in ["creator", "date", "description", "publisher", "rights"]:
-            found = elem.find(f"dc:{dc_elem}", NS)
-            if found is not None and found.text:
-                metadata[dc_elem] = found.text
-
-        # Common UPnP elements
-        for upnp_elem in [
-            "artist",
-            "album",
-            "genre",
-            "albumArtURI",
-            "originalTrackNumber",
-            "playbackCount",
-            "lastPlaybackTime",
-            "rating",
-        ]:
-            found = elem.find(f"upnp_meta:{upnp_elem}", NS)
-            if found is not None and found.text:
-                metadata[upnp_elem] = found.text
+        # What's left are the metadata elements actually present
+        metadata: dict[str, Any] = {key: text for key, text in texts.items() if text}
 
         return MediaItem(
             id=item_id,
@@ -662,71 +943,91 @@ class DLNATester:
         if body is None:
             return None
 
-        ns = "{urn:schemas-upnp-org:service:ContentDirectory:1}"
-        result_elem = body.find(f".//{ns}Result")
-        if result_elem is None:
-            result_elem = body.find(".//Result")
-
-        num_returned_elem = body.find(f".//{ns}NumberReturned")
-        if num_returned_elem is None:
-            num_returned_elem = body.find(".//NumberReturned")
-
-        total_matches_elem = body.find(f".//{ns}TotalMatches")
-        if total_matches_elem is None:
-            total_matches_elem = body.find(".//TotalMatches")
-
-        if result_elem is None or result_elem.text is None:
+        parsed = self._parse_browse_response(body)
+        if parsed is None:
             return [], 0, 0
+        return parsed
 
-        try:
-            number_returned = (
-                int(num_returned_elem.text)
-                if num_returned_elem is not None and num_returned_elem.text
-                else 0
-            )
-            total_matches = (
-                int(total_matches_elem.text)
-                if total_matches_elem is not None and total_matches_elem.text
-                else 0
-            )
-        except ValueError:
-            number_returned = 0
-            total_matches = 0
-
-        items = self._parse_didl_lite(result_elem.text)
-        return items, number_returned, total_matches
-
-    def fetch_resource(self, url: str) -> tuple[bytes | None, str | None]:
+    def fetch_resource(
+        self, url: str, timeout: float | None = None
+    ) -> tuple[bytes | None, str | None]:
         """Fetch a media resource to verify accessibility.
 
         Args:
             url: The resource URL
+            timeout: Timeout in seconds for this request (default: client timeout)
 
         Returns:
             Tuple of (partial content, content-type), or (None, None) on error
         """
         full_url = self._make_url(url)
+        cached = self._resource_cache.get(("GET", full_url))
+        if cached is not None:
+            return cached
         try:
-            # Only fetch headers and first few bytes to verify accessibility
-            response = self.client.get(
-                full_url, headers={"Range": "bytes=0-1023"}, follow_redirects=True
-            )
-            if response.status_code in (200, 206):
-                return response.content, response.headers.get("Content-Type")
+            # Only fetch headers and first few bytes to verify accessibility.
+            # The body is streamed and cut off at 1 KiB, in case the server
+            # ignores Range and starts sending the whole file.
+            with self.client.stream(
+                "GET",
+                full_url,
+                headers={"Range": "bytes=0-1023"},
+                follow_redirects=True,
+                timeout=httpx.USE_CLIENT_DEFAULT if timeout is None else timeout,
+            ) as response:
+                if response.status_code in (200, 206):
+                    content = b""
+                    for chunk in response.iter_bytes():
+                        content += chunk
+                        if len(content) >= 1024:
+                            break
+                    result = content[:1024], response.headers.get("Content-Type")
+                    if _may_store(response):
+                        self._resource_cache["GET", full_url] = result
+                    return result
         except Exception:
             pass
         return None, None
 
-    def check_resource_headers(self, url: str) -> dict[str, Any]:
+    def check_range_support(self, url: str, timeout: float | None = None) -> bool:
+        """Check whether a media resource honours byte Range requests.
+
+        Only the status line and headers are read; the body is abandoned.
+
+        Args:
+            url: The resource URL
+            timeout: Timeout in seconds for this request (default: client timeout)
+
+        Returns:
+            True if the server answered with partial content, False otherwise
+        """
+        full_url = self._make_url(url)
+        try:
+            with self.client.stream(
+                "GET",
+                full_url,
+                headers={"Range": "bytes=0-0"},
+                follow_redirects=True,
+                timeout=httpx.USE_CLIENT_DEFAULT if timeout is None else timeout,
+            ) as response:
+                return response.status_code == 206 or "Content-Range" in response.headers
+        except Exception:
+            return False
+
+    def check_resource_headers(self, url: str, timeout: float | None = None) -> dict[str, Any]:
         """Check headers for a media resource (HEAD request).
 
         Args:
             url: The resource URL
+            timeout: Timeout in seconds for this request (default: client timeout)
 
         Returns:
             Dict with header information
         """
         full_url = self._make_url(url)
+        cached = self._resource_cache.get(("HEAD", full_url))
+        if cached is not None:
+            return dict(cached)
         result: dict[str, Any] = {
             "accessible": False,
             "content_type": None,
@@ -736,7 +1037,11 @@ class DLNATester:
         }
 
         try:
-            response = self.client.head(full_url, follow_redirects=True)
+            response = self.client.head(
+                full_url,
+                follow_redirects=True,
+                timeout=httpx.USE_CLIENT_DEFAULT if timeout is None else timeout,
+            )
             if response.status_code == 200:
                 result["accessible"] = True
                 result["content_type"] = response.headers.get("Content-Type")
@@ -745,6 +1050,8 @@ class DLNATester:
                 result["transfer_mode"] = response.headers.get(
                     "transferMode.dlna.org"
                 )
+                if _may_store(response):
+                    self._resource_cache["HEAD", full_url] = dict(result)
         except Exception:
             pass
 